@@ -1,23 +1,25 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
 
-from IPython.display import display, Javascript, Pretty
-from IPython.core.magic import register_cell_magic
 from ._native import QSharpError
 from ._qsharp import get_interpreter
 import pathlib
 
+_CODEMIRROR_JS_PATH = (
+    pathlib.Path(__file__).parent.resolve().joinpath(".data", "qsharp_codemirror.js")
+)
+_codemirror_js = None
+
 
 def register_magic():
+    from IPython.display import display, Pretty
+    from IPython.core.magic import register_cell_magic
+
     @register_cell_magic
     def qsharp(line, cell):
         """Cell magic to interpret Q# code in Jupyter notebooks."""
-
-        def callback(output):
-            display(output)
-
         try:
-            return get_interpreter().interpret(cell, callback)
+            return get_interpreter().interpret(cell, display)
         except QSharpError as e:
             display(Pretty(str(e)))
 
@@ -28,13 +30,12 @@ def enable_classic_notebook_codemirror_mode():
     and defines a CodeMirror mode to enable syntax highlighting.
     This only works in "classic" Jupyter notebooks, not Notebook v7.
     """
-    js_to_inject = open(
-        pathlib.Path(__file__)
-        .parent.resolve()
-        .joinpath(".data", "qsharp_codemirror.js"),
-        mode="r",
-        encoding="utf-8",
-    ).read()
+    from IPython.display import display, Javascript
+
+    global _codemirror_js
+    if _codemirror_js is None:
+        with open(_CODEMIRROR_JS_PATH, mode="rb") as f:
+            _codemirror_js = f.read().decode("utf-8")
 
     # Extend the JavaScript display helper to print nothing when used
     # in a non-browser context (i.e. IPython console)
@@ -43,4 +44,4 @@ def enable_classic_notebook_codemirror_mode():
             return ""
 
     # This will run the JavaScript in the context of the frontend.
-    display(JavaScriptWithPlainTextFallback(js_to_inject))
+    display(JavaScriptWithPlainTextFallback(_codemirror_js))
@@ -2,7 +2,7 @@
 # Licensed under the MIT License.
 
 from enum import Enum
-from typing import Any, Callable, ClassVar, Tuple, Optional
+from typing import Any, Callable, ClassVar, Tuple, Optional, Union
 
 class TargetProfile:
     """
@@ -37,11 +37,14 @@ class Interpreter:
         :param target_profile: The target profile to use for the interpreter.
         """
         ...
-    def interpret(self, input: str, output_fn: Callable[[Output], None]) -> Any:
+    def interpret(
+        self, input: Union[str, bytes], output_fn: Callable[[Output], None]
+    ) -> Any:
         """
         Interprets Q# source code.
 
-        :param input: The Q# source code to interpret.
+        :param input: The Q# source code to interpret, either as a string
+            or as UTF-8 encoded bytes.
         :param output_fn: A callback function that will be called with each output.
 
         :returns value: The value returned by the last statement in the input.
@@ -24,7 +24,6 @@ def get_interpreter() -> Interpreter:
 
     :returns: The Q# interpreter.
     """
-    global _interpreter
     if _interpreter is None:
         init()
     return _interpreter
@@ -36,15 +35,12 @@ def eval(source):
 
     Output is printed to console.
 
-    :param source: The Q# source code to evaluate.
+    :param source: The Q# source code to evaluate, either as a string
+        or as UTF-8 encoded bytes.
     :returns value: The value returned by the last statement in the source code.
     :raises QSharpError: If there is an error evaluating the source code.
     """
-
-    def callback(output):
-        print(output)
-
-    return get_interpreter().interpret(source, callback)
+    return get_interpreter().interpret(source, print)
 
 
 def eval_file(path):
@@ -55,8 +51,11 @@ def eval_file(path):
     :returns: The value returned by the last statement in the file.
     :raises: QSharpError
     """
-    f = open(path, mode="r", encoding="utf-8")
-    return eval(f.read())
+    # The interpreter accepts UTF-8 bytes directly, so the file
+    # contents are passed through without decoding them here.
+    with open(path, mode="rb") as f:
+        source = f.read()
+    return eval(source)
 
 
 def run(entry_expr, shots):
@@ -71,11 +70,7 @@ def run(entry_expr, shots):
 
     :raises QSharpError: If there is an error interpreting the input.
     """
-
-    def callback(output):
-        print(output)
-
-    return get_interpreter().run(entry_expr, shots, callback)
+    return get_interpreter().run(entry_expr, shots, print)
 
 
 def compile(entry_expr):
@@ -104,15 +99,17 @@ def dump_machine() -> StateDump:
 # that is defined by the azure-quantum package.
 # See: https://github.com/microsoft/qdk-python/blob/fcd63c04aa871e49206703bbaa792329ffed13c4/azure-quantum/azure/quantum/target/target.py#L21
 class QirInputData:
+    __slots__ = ("_name", "_ll_bytes")
+
     # The name of this variable is defined
     # by the protocol and must remain unchanged.
     _name: str
 
     def __init__(self, name: str, ll_str: str):
         self._name = name
-        self._ll_str = ll_str
+        self._ll_bytes = ll_str.encode("utf-8")
 
     # The name of this method is defined
     # by the protocol and must remain unchanged.
     def _repr_qir_(self, **kwargs) -> bytes:
-        return self._ll_str.encode("utf-8")
+        return self._ll_bytes
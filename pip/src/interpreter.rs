@@ -7,7 +7,7 @@ use num_bigint::BigUint;
 use num_complex::Complex64;
 use pyo3::{
     create_exception,
-    exceptions::PyException,
+    exceptions::{PyException, PyUnicodeDecodeError},
     prelude::*,
     pyclass::CompareOp,
     types::PyList,
@@ -84,7 +84,7 @@ impl Interpreter {
 
     /// Interprets Q# source code.
     ///
-    /// :param input: The Q# source code to interpret.
+    /// :param input: The Q# source code to interpret, either as a string or as UTF-8 encoded bytes.
     /// :param output_fn: A callback function that will be called with each output.
     ///
     /// :returns value: The value returned by the last statement in the input.
@@ -93,9 +93,10 @@ impl Interpreter {
     fn interpret(
         &mut self,
         py: Python,
-        input: &str,
+        input: Source<'_>,
         callback: Option<PyObject>,
     ) -> PyResult<PyObject> {
+        let input = input.as_str(py)?;
         let mut receiver = OptionalCallbackReceiver { callback, py };
         match self.interpreter.eval_fragments(&mut receiver, input) {
             Ok(value) => Ok(ValueWrapper(value).into_py(py)),
@@ -143,6 +144,34 @@ impl Interpreter {
     }
 }
 
+/// Q# source code passed in from Python.
+///
+/// Accepting UTF-8 encoded bytes lets callers that read source from disk
+/// hand over the file contents without decoding them into a `str` first.
+#[derive(FromPyObject)]
+enum Source<'a> {
+    #[pyo3(annotation = "str")]
+    Str(&'a str),
+    #[pyo3(annotation = "bytes")]
+    Bytes(&'a [u8]),
+}
+
+impl<'a> Source<'a> {
+    fn as_str(self, py: Python) -> PyResult<&'a str> {
+        match self {
+            Source::Str(s) => Ok(s),
+            Source::Bytes(b) => std::str::from_utf8(b).map_err(|e| {
+                // Build a fully populated UnicodeDecodeError; its constructor
+                // does not accept a lone message string.
+                match PyUnicodeDecodeError::new_utf8(py, b, e) {
+                    Ok(err) => PyErr::from_value(err),
+                    Err(err) => err,
+                }
+            }),
+        }
+    }
+}
+
 create_exception!(
     module,
     QSharpError,
@@ -198,25 +227,12 @@ pub(crate) struct StateDump(pub(crate) DisplayableState);
 #[pymethods]
 impl StateDump {
     fn get_dict(&self, py: Python) -> Py<PyDict> {
-        PyDict::from_sequence(
-            py,
-            PyList::new(
-                py,
-                self.0
-                     .0
-                    .iter()
-                    .map(|(k, v)| {
-                        PyTuple::new(
-                            py,
-                            &[k.clone().into_py(py), PyTuple::new(py, [v.re, v.im]).into()],
-                        )
-                    })
-                    .collect::<Vec<_>>(),
-            )
-            .into_py(py),
-        )
-        .expect("should be able to create dict")
-        .into_py(py)
+        let dict = PyDict::new(py);
+        for (k, v) in &self.0 .0 {
+            dict.set_item(k, (v.re, v.im))
+                .expect("should be able to insert into dict");
+        }
+        dict.into_py(py)
     }
 
     #[getter]
@@ -66,6 +66,25 @@ def test_dump_machine() -> None:
     assert state_dict[1][0] == 1.0
     assert state_dict[1][1] == 0.0
 
+
+def test_dump_machine_get_dict_superposition() -> None:
+    e = Interpreter(TargetProfile.Full)
+    e.interpret(
+        """
+    use q1 = Qubit();
+    use q2 = Qubit();
+    H(q1);
+    X(q2);
+    """
+    )
+    state_dict = e.dump_machine().get_dict()
+    assert isinstance(state_dict, dict)
+    assert sorted(state_dict.keys()) == [2, 3]
+    for re, im in state_dict.values():
+        assert re == pytest.approx(0.5**0.5)
+        assert im == pytest.approx(0.0)
+
+
 def test_error() -> None:
     e = Interpreter(TargetProfile.Full)
 
@@ -89,6 +108,24 @@ def test_multiple_statements() -> None:
     assert value == Result.Zero
 
 
+def test_bytes_input() -> None:
+    e = Interpreter(TargetProfile.Full)
+    value = e.interpret('"héllo"'.encode("utf-8"))
+    assert value == "héllo"
+
+
+def test_invalid_utf8_bytes_input() -> None:
+    e = Interpreter(TargetProfile.Full)
+    with pytest.raises(UnicodeDecodeError):
+        e.interpret(b"\xff")
+
+
+def test_invalid_input_type() -> None:
+    e = Interpreter(TargetProfile.Full)
+    with pytest.raises(TypeError):
+        e.interpret(5)
+
+
 def test_value_int() -> None:
     e = Interpreter(TargetProfile.Full)
     value = e.interpret("5")
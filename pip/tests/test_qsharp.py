@@ -32,6 +32,19 @@ def test_stdout_multiple_lines() -> None:
 
     assert f.getvalue() == "STATE:\n|0⟩: 1.0000+0.0000𝑖\nHello!\n"
 
+
+def test_eval_file(tmp_path) -> None:
+    qsharp.init(target_profile=qsharp.TargetProfile.Full)
+    path = tmp_path / "test.qs"
+    path.write_text('Message("Héllo, wörld!"); "ünicode"', encoding="utf-8")
+    f = io.StringIO()
+    with redirect_stdout(f):
+        result = qsharp.eval_file(path)
+
+    assert result == "ünicode"
+    assert f.getvalue() == "Héllo, wörld!\n"
+
+
 def test_dump_machine() -> None:
     qsharp.init(target_profile=qsharp.TargetProfile.Full)
     qsharp.eval(